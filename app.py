@@ -1,5 +1,6 @@
 import os
 import json
+import gzip
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
 import google.generativeai as genai
@@ -7,6 +8,11 @@ import requests
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import brotli  # optional: enables `br` response compression
+except ImportError:
+    brotli = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -26,6 +32,36 @@ chat_history = []
 current_city = None
 current_weather = None
 
+# HTTP response caching / compression
+COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies are not worth compressing
+COMPRESS_CACHE_MAX_ENTRIES = 256
+INDEX_MAX_AGE = 300  # seconds
+COUNTRY_MAX_AGE = 86400  # seconds
+_compressed_cache = {}  # (etag, encoding) -> compressed body
+
+# Country name -> ISO 3166-1 alpha-2 code lookups for flags
+COUNTRY_CODES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "country_codes.json")
+FLAG_CDN_URL = "https://flagcdn.com/w80"
+
+
+def _normalize_country(name):
+    """Normalize a country name for case/whitespace-insensitive lookups."""
+    return " ".join((name or "").split()).casefold()
+
+
+def _load_country_codes():
+    """Load the bundled country name -> ISO code table. Returns {} if unavailable."""
+    try:
+        with open(COUNTRY_CODES_PATH, encoding="utf-8") as f:
+            table = json.load(f)
+        return {_normalize_country(name): code.lower() for name, code in table.items()}
+    except Exception as e:
+        print(f"Error loading country codes: {e}")
+        return {}
+
+
+COUNTRY_CODES = _load_country_codes()  # normalized name -> lowercase ISO code
+
 def get_weather(city_name):
     """Fetch weather data for a city from wttr.in."""
     try:
@@ -64,6 +100,30 @@ def get_weather(city_name):
         return None
 
 
+def get_country_code(country_name):
+    """Resolve a country name to a lowercase ISO 3166-1 alpha-2 code using the
+    bundled table (loaded into memory once at startup). Returns None if not found."""
+    return COUNTRY_CODES.get(_normalize_country(country_name))
+
+
+def _compress(data, encoding, best=False):
+    """Compress `data` with the given content-coding ('br' or 'gzip').
+    `best` trades CPU for size; use it only for bodies that get cached."""
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if best else 5)
+    return gzip.compress(data, compresslevel=9 if best else 6)
+
+
+def _negotiate_encoding():
+    """Pick the best content-coding the client accepts, or None."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
 def _select_model(preferred=None):
     """Try to pick a working generative model. Returns a GenerativeModel instance or None."""
     # If a specific model is provided via environment, try it first
@@ -461,10 +521,67 @@ def chat_with_tour_guide(user_message):
         print(f"Error in chat: {e}")
         return f"I apologize, but I encountered an error: {str(e)}"
 
+@app.after_request
+def cache_and_compress(response):
+    """Add ETags/conditional GET handling and gzip/brotli compression to responses.
+    Compressed bodies of cacheable (GET) responses are kept per ETag so repeat
+    requests for the page or country lookups are served precompressed."""
+    if response.direct_passthrough or response.status_code != 200 or "Content-Encoding" in response.headers:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    cacheable = request.method in ("GET", "HEAD")
+    if cacheable:
+        if not response.headers.get("Cache-Control"):
+            response.cache_control.no_cache = True
+        # Weak ETag: the same validator covers the identity and compressed variants
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+        if response.status_code != 200:
+            return response  # 304 Not Modified
+
+    encoding = _negotiate_encoding()
+    if encoding is None or request.method == "HEAD":
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    etag = response.get_etag()[0] if cacheable else None
+    compressed = _compressed_cache.get((etag, encoding)) if etag else None
+    if compressed is None:
+        compressed = _compress(data, encoding, best=bool(etag))
+        if etag:
+            if len(_compressed_cache) >= COMPRESS_CACHE_MAX_ENTRIES:
+                _compressed_cache.clear()
+            _compressed_cache[(etag, encoding)] = compressed
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
 @app.route('/')
 def index():
     """Render the main page."""
-    return render_template('index.html')
+    response = app.make_response(render_template('index.html'))
+    response.cache_control.public = True
+    response.cache_control.max_age = INDEX_MAX_AGE
+    return response
+
+@app.route('/api/country/<name>', methods=['GET'])
+def country_endpoint(name):
+    """API endpoint to resolve a country name to its ISO code and flag image URL."""
+    code = get_country_code(name)
+    if not code:
+        return jsonify({"error": f"Unknown country: {name}"}), 404
+    response = jsonify({
+        "country": name,
+        "code": code,
+        "flag_url": f"{FLAG_CDN_URL}/{code}.png"
+    })
+    response.cache_control.public = True
+    response.cache_control.max_age = COUNTRY_MAX_AGE
+    return response
 
 @app.route('/api/weather', methods=['POST'])
 def weather_endpoint():
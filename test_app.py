@@ -0,0 +1,58 @@
+"""Smoke tests for HTTP caching/compression and the country lookup endpoint."""
+import gzip
+
+import pytest
+
+import app as app_module
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def test_index_conditional_get_returns_304(client):
+    first = client.get('/')
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+    assert 'max-age=' in first.headers['Cache-Control']
+
+    second = client.get('/', headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
+
+
+def test_index_gzip_compressed(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'brotli', None)
+    plain = client.get('/').data
+    resp = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in resp.headers['Vary']
+    assert gzip.decompress(resp.data) == plain
+
+
+def test_index_brotli_preferred(client):
+    brotli = pytest.importorskip('brotli')
+    plain = client.get('/').data
+    resp = client.get('/', headers={'Accept-Encoding': 'gzip, br'})
+    assert resp.headers['Content-Encoding'] == 'br'
+    assert 'Accept-Encoding' in resp.headers['Vary']
+    assert brotli.decompress(resp.data) == plain
+
+
+def test_index_uncompressed_without_accept_encoding(client):
+    resp = client.get('/')
+    assert 'Content-Encoding' not in resp.headers
+    assert b'<html' in resp.data.lower()
+
+
+def test_country_lookup(client):
+    resp = client.get('/api/country/United%20States%20of%20America')
+    assert resp.status_code == 200
+    assert resp.json['code'] == 'us'
+    assert resp.json['flag_url'].endswith('/us.png')
+
+
+def test_country_unknown_and_slash_rejected(client):
+    assert client.get('/api/country/Atlantis').status_code == 404
+    assert client.get('/api/country/..%2Fall').status_code == 404